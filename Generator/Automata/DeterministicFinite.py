@@ -52,7 +52,7 @@ class DeterministicFinite(object):
         visited = set([self.start_state])
         while len(state_queue) > 0:
             next_state = state_queue.pop()
-            for destination in next_state.edges.iterkeys():
+            for destination in next_state.edges.keys():
                 if destination not in visited:
                     visited.add(destination)
                     state_queue.appendleft(destination)
@@ -87,7 +87,7 @@ class DeterministicFinite(object):
             def format_codepoint(codepoint):
                 if codepoint == ord('"'):
                     return "'\\\"'"
-                if codepoint in xrange(32, 127):
+                if 32 <= codepoint < 127:
                     return "'%s'" % chr(codepoint).replace("\\", "\\\\")
                 else:
                     return "0x%x" % codepoint
@@ -98,7 +98,7 @@ class DeterministicFinite(object):
                 else:
                     return "%s-%s" % tuple([format_codepoint(i) for i in range])
             
-            for destination, edges in state.edges.iteritems():
+            for destination, edges in state.edges.items():
                 edge_label = ", ".join([format_case(i) for i in edges])
                 descriptions.append('    %d -> %d [label="%s"]' % (state_index, states.index(destination), edge_label))
            
@@ -114,7 +114,7 @@ class DeterministicFinite(object):
             new_states[state].is_final = state.is_final
             new_states[state].ids = state.ids
             new_states[state].final_ids = state.final_ids
-            for destination, edges in state.edges.iteritems():
+            for destination, edges in state.edges.items():
                 new_states[state].edges[new_states[destination]].update(edges)
         self_copy = DeterministicFinite()
         self_copy.start_state = new_states[self.start_state]
@@ -158,7 +158,7 @@ class DeterministicFinite(object):
             self_state, other_state = state_queue.pop()
             if len(self_state.edges) != len(other_state.edges):
                 return False
-            for self_destination, self_edge in self_state.edges.iteritems():
+            for self_destination, self_edge in self_state.edges.items():
                 if self_destination in state_map:
                     # We have visited this destination - Make sure edges leading to it are identical
                     other_destination = state_map[self_destination]
@@ -169,7 +169,7 @@ class DeterministicFinite(object):
                 else:
                     # We have not visited this destination - Search for matching edge in other DFA
                     other_destination = None
-                    for possible_destination, other_edge in other_state.edges.iteritems():
+                    for possible_destination, other_edge in other_state.edges.items():
                         if (other_edge == self_edge and 
                             frozenset(self_destination.final_ids) == frozenset(possible_destination.final_ids) and
                             self_destination.is_final == possible_destination.is_final):
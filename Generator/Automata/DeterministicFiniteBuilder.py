@@ -88,7 +88,7 @@ class DeterministicFiniteBuilder(object):
             self.states[state_id].is_final = True
         
         # For each set of epsilon-closed NFA states, find the set of states that each edge leads to and recurse.
-        merged_transitions = itertools.chain(*[i.edges.iteritems() for i in state_id])
+        merged_transitions = itertools.chain(*[i.edges.items() for i in state_id])
         pairs = iter((edge, destination) for destination, edge in merged_transitions)
         for (min_v, max_v), destination_nfa_states in CoverageSet.segments(*pairs):
             destination_state_id = frozenset(EpsilonClosureCrawler(destination_nfa_states).get_states())
@@ -47,7 +47,7 @@ def minimize(state_machine):
     group_map = collections.defaultdict(StateGroup)
     for state in states:
         group_map[hash(frozenset(state.final_ids))].add(state)
-    distinct_groups = set(group_map.itervalues())
+    distinct_groups = set(group_map.values())
     
     # Step 2: Iteritively partition based the signals going out of each partition
     group_was_split = True
@@ -65,12 +65,12 @@ def minimize(state_machine):
             new_groups = collections.defaultdict(StateGroup)
             for state in group:
                 outgoing_edges = collections.defaultdict(CoverageSet)
-                for destination, edge in state.edges.iteritems():
+                for destination, edge in state.edges.items():
                     outgoing_edges[state_to_group[destination]].update(edge)
-                new_groups[tuple(sorted(outgoing_edges.iteritems()))].add(state)
+                new_groups[tuple(sorted(outgoing_edges.items()))].add(state)
             if len(new_groups) > 1:
                 groups_to_delete.add(group)
-                groups_to_add.update(new_groups.itervalues())
+                groups_to_add.update(new_groups.values())
         distinct_groups.difference_update(groups_to_delete)
         distinct_groups.update(groups_to_add)
         if len(groups_to_add) > 0:
@@ -82,9 +82,9 @@ def minimize(state_machine):
         if len(group) > 1:
             to_merge = group[1:]
             for state in group[1:]:
-                for destination, edge in state.edges.iteritems():
+                for destination, edge in state.edges.items():
                     group[0].edges[destination].update(edge)
-            for edge in group[0].edges.itervalues():
+            for edge in group[0].edges.values():
                 edge.remove_overlap()
             for state in states:
                 for destination_state in state.edges.keys():
@@ -53,10 +53,10 @@ def minimize(state_machine):
         for i in range(len(states)):
             for j in range(i):
                 if pair_id(i, j) not in is_distinct:
-                    all_edges = itertools.chain(states[i].edges.itervalues(), states[j].edges.itervalues())
+                    all_edges = itertools.chain(states[i].edges.values(), states[j].edges.values())
                     for (min_v, max_v), ids in CoverageSet.segments(*((edge, index) for index, edge in enumerate(all_edges))):
-                        destination_i = next((k for k, v in states[i].edges.iteritems() if min_v in v), None)
-                        destination_j = next((k for k, v in states[j].edges.iteritems() if min_v in v), None)
+                        destination_i = next((k for k, v in states[i].edges.items() if min_v in v), None)
+                        destination_j = next((k for k, v in states[j].edges.items() if min_v in v), None)
                         
                         # States are distinct if alphabets not the same
                         if destination_i is None or destination_j is None:
@@ -90,7 +90,7 @@ def minimize(state_machine):
    
     # Step 4: Merge non-distinct states
     state_to_merged = {}
-    for i in xrange(len(non_distinct_groups)):
+    for i in range(len(non_distinct_groups)):
         non_distinct_groups[i] = list(non_distinct_groups[i])
     for group in non_distinct_groups:
         for state_index, state in [(i, states[i]) for i in group]:
@@ -102,9 +102,9 @@ def minimize(state_machine):
         to_merge = [states[i] for i in group[1:]]
         merge_into = states[group[0]]
         for state in to_merge:
-            for destination, edge in state.edges.iteritems():
+            for destination, edge in state.edges.items():
                 merge_into.edges[state_to_merged[destination]].update(edge)
-        for edge in merge_into.edges.itervalues():
+        for edge in merge_into.edges.values():
             edge.remove_overlap()
         for state in states:
             for destination in state.edges.keys():
@@ -62,7 +62,7 @@ class NonDeterministicFinite(object):
                 if destination not in visited:
                     visited.add(destination)
                     state_queue.appendleft(destination)
-            for destination in next_state.edges.iterkeys():
+            for destination in next_state.edges.keys():
                 if destination not in visited:
                     visited.add(destination)
                     state_queue.appendleft(destination)
@@ -91,7 +91,7 @@ class NonDeterministicFinite(object):
             def format_codepoint(codepoint):
                 if codepoint in [ord('\\'), ord('"')]:
                     return "'\\%s'" % chr(codepoint)
-                elif codepoint in xrange(32, 127):
+                elif 32 <= codepoint < 127:
                     return "'%s'" % chr(codepoint)
                 else:
                     return "0x%x" % codepoint
@@ -102,7 +102,7 @@ class NonDeterministicFinite(object):
                 else:
                     return "%s-%s" % tuple([format_codepoint(i) for i in range])
                     
-            for destination, edges in state.edges.iteritems():
+            for destination, edges in state.edges.items():
                 edge_label = ", ".join([format_case(i) for i in edges])
                 descriptions.append('    %d -> %d [label="%s"]' % (state_index, states.index(destination), edge_label))
 
@@ -121,7 +121,7 @@ class NonDeterministicFinite(object):
             return state_machines[0]
 
         # Chain state machines with epsilons
-        for i in xrange(len(state_machines)-1):
+        for i in range(len(state_machines)-1):
             for state in state_machines[i]:
                 if state_machines[i].end_state in state.epsilon_edges:
                     state.epsilon_edges.remove(state_machines[i].end_state)
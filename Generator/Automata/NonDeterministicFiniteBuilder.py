@@ -91,14 +91,14 @@ class NonDeterministicFiniteBuilder(object):
                 repetition_min -= 1
             
         elif repetition.max > repetition_min:
-            state_machines = [copy.deepcopy(child_state_machine) for i in xrange(repetition.max - repetition_min)]
+            state_machines = [copy.deepcopy(child_state_machine) for i in range(repetition.max - repetition_min)]
             for state_machine in state_machines:
                 state_machine.start_state.epsilon_edges.add(state_machine.end_state)
             state_machine = NonDeterministicFinite.concatenate(state_machines)
             
         # Prepend minimal repetition 
         if repetition_min > 0:
-            head_state_machines = [copy.deepcopy(child_state_machine) for i in xrange(repetition_min)]
+            head_state_machines = [copy.deepcopy(child_state_machine) for i in range(repetition_min)]
             head_state_machine = NonDeterministicFinite.concatenate(head_state_machines)
             if state_machine is None:
                 state_machine = head_state_machine
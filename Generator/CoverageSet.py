@@ -19,7 +19,6 @@
 # DEALINGS IN THE SOFTWARE.
 
 import blist
-import itertools
 
 class CoverageSet(object):
     """
@@ -36,17 +35,13 @@ class CoverageSet(object):
             
     def __iter__(self):
         self.remove_overlap()
+        # Endpoints alternate between minimums and maximums, so pair them up in a single pass
         interval_endpoints = iter(self.intervals)
-        while True:
-            try:
-                min_v, is_end = next(interval_endpoints)
-                max_v, is_end = next(interval_endpoints)
-                yield (min_v, max_v)
-            except StopIteration:
-                break
+        for (min_v, min_is_end), (max_v, max_is_end) in zip(interval_endpoints, interval_endpoints):
+            yield (min_v, max_v)
                 
     def is_empty(self):
-        return len(self.intervals) >= 2
+        return len(self.intervals) == 0
     
     def merge_adjacent(self):
         """
@@ -67,7 +62,7 @@ class CoverageSet(object):
         """
         Internal method. Merges overlapping intervals.
         """
-        reverse_enumerate = lambda l: itertools.izip(xrange(len(l)-1, -1, -1), reversed(l))
+        reverse_enumerate = lambda l: zip(range(len(l)-1, -1, -1), reversed(l))
         if self.dirty:
             level = 0
             did_remove = False
@@ -145,7 +140,7 @@ class CoverageSet(object):
         """
         for coverage_set in other_coverage_sets:
             coverage_set.remove_overlap()
-            for i in xrange(0, len(coverage_set.intervals), 2):
+            for i in range(0, len(coverage_set.intervals), 2):
                 (min_v, min_is_end), (max_v, max_is_end) = coverage_set.intervals[i:i+2]
                 self.remove(min_v, max_v)
                 
@@ -165,7 +160,7 @@ class CoverageSet(object):
         def format_codepoint(codepoint):
             if codepoint == ord('"'):
                 return "'\\\"'"
-            if codepoint in xrange(32, 127):
+            if 32 <= codepoint < 127:
                 return "'%s'" % chr(codepoint)
             else:
                 return "0x%x" % codepoint
@@ -188,7 +183,7 @@ class CoverageSet(object):
         
         @param other_coverage_sets: one or more other CoverageSet objects.
         """
-        reverse_enumerate = lambda l: itertools.izip(xrange(len(l)-1, -1, -1), reversed(l))
+        reverse_enumerate = lambda l: zip(range(len(l)-1, -1, -1), reversed(l))
         for other_coverage_set in other_coverage_sets:
             other_coverage_set.remove_overlap()
         self.update(*other_coverage_sets)
@@ -317,7 +312,7 @@ class CoverageSet(object):
     def __len__(self):
         self.remove_overlap()
         n = 0
-        for i in xrange(0, len(self.intervals), 2):
+        for i in range(0, len(self.intervals), 2):
             (min_v, min_is_end), (max_v, max_is_end) = self.intervals[i:i+2]
             n += max_v - min_v + 1
         return n
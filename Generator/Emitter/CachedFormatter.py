@@ -23,6 +23,7 @@ class CachedFormatter(object):
         def __init__(self):
             self.keys = {}
             self.values = set()
+            self.suffixes = {}
 
     """
     Utility class for maintaining a list of names mapped to objects. Duplicate
@@ -48,13 +49,17 @@ class CachedFormatter(object):
             return cache.keys[key]
         if formatter is not None:
             value = formatter(key)
-        n = 1
+        # Resume numbering where the last duplicate of this name left off, 
+        # rather than re-testing every suffix already taken
+        caseless_value = value.lower()
+        n = cache.suffixes.get(caseless_value, 1)
         candidate = value[:self.limit]
         while candidate.lower() in cache.values or candidate.lower() in self.reserved:
             suffix = str(n)
             prefix = value[:self.limit-len(suffix)]
             candidate = prefix + suffix
             n += 1
+        cache.suffixes[caseless_value] = n
         cache.keys[key] = candidate
         cache.values.add(candidate.lower())
         return candidate
@@ -80,6 +85,7 @@ class CachedFormatter(object):
         def clear():
             cache.keys = {}
             cache.values = set()
+            cache.suffixes = {}
         setattr(self, 'get_' + name, get_value)
         setattr(self, 'add_' + name, add_value)
         setattr(self, 'clear_' + name + 's', clear)
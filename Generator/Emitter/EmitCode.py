@@ -89,11 +89,11 @@ class CodeEmitter(object):
         Write a single indented line at once.
         @param text: string containing the contents of the line.
         """
-        lines = text.split("\n")
-        for line in lines:
-            self.open_line()
-            self.write(line)
-            self.close_line()
+        indent = ' '*self.indent_size
+        if "\n" in text:
+            self.write(''.join(indent + line + '\n' for line in text.split("\n")))
+        else:
+            self.write(indent + text + '\n')
             
     def block(self, opening_line="", closing_line=""):
         """
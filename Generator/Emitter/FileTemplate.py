@@ -19,6 +19,58 @@
 # DEALINGS IN THE SOFTWARE.
 
 import re
+import os
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+pattern_variablename = r"[a-zA-Z][a-zA-Z0-9_]*"
+pattern_loose = r"\$(?P<loose>%s)" % pattern_variablename
+pattern_tight = r"\$\{(?P<tight>%s)\}" % pattern_variablename
+pattern_instance = re.compile(r"(%s|%s)" % (pattern_loose, pattern_tight))
+pattern_entireline = re.compile(r"^(?P<whitespace>[ \t]*)%s$" % (pattern_instance.pattern))
+
+# Parsed templates, mapping absolute paths to tuples of modification time and segments
+_template_cache = {}
+
+def get_var_name(match):
+    if match.group('loose') is not None:
+        return match.group('loose')
+    else:
+        return match.group('tight')
+
+def parse_template(in_filename):
+    """
+    Splits a template file into a list of segments. Results are cached until the file is modified.
+    Each segment is a tuple containing the following:
+        1. A string containing text to copy verbatim to the output file
+        2. A string containing the name of the token following the text, or None if there is no token
+        3. If the token is the first non-whitespace of a line, an integer with the indentation, otherwise None.
+    @param in_filename: string containing the name of the template file to parse
+    @return: list of segment tuples
+    """
+    path = os.path.abspath(in_filename)
+    mtime = os.stat(in_filename).st_mtime
+    if path in _template_cache:
+        cached_mtime, segments = _template_cache[path]
+        if cached_mtime == mtime:
+            return segments
+        
+    segments = []
+    with open(in_filename, 'rU') as in_file:
+        for line in in_file:
+            match = pattern_entireline.search(line)
+            if match is not None:
+                segments.append(("", get_var_name(match), len(match.group('whitespace'))))
+            else:
+                start = 0
+                for match in pattern_instance.finditer(line):
+                    segments.append((line[start:match.start(0)], get_var_name(match), None))
+                    start = match.end(0)
+                segments.append((line[start:], None, None))
+    _template_cache[path] = (mtime, segments)
+    return segments
 
 def FileTemplate(in_filename, out_filename):
     """
@@ -28,32 +80,25 @@ def FileTemplate(in_filename, out_filename):
         1. A Python file object representing the output file
         2. A string containing the name of the token
         3. If the token is the first non-whitespace of a line, an integer with the indentation, otherwise None.
+    The output file is only rewritten if its contents have changed, so that its modification
+    time can be relied on by build tools.
     @param in_filename: string containing the name of the template file to copy
     @param out_filename: string containing the name of the filled-in template file to write.
     """
-    pattern_variablename = r"[a-zA-Z][a-zA-Z0-9_]*"
-    pattern_loose = r"\$(?P<loose>%s)" % pattern_variablename
-    pattern_tight = r"\$\{(?P<tight>%s)\}" % pattern_variablename
-    pattern_instance = r"(%s|%s)" % (pattern_loose, pattern_tight)
-    pattern_entireline = r"^(?P<whitespace>[ \t]*)%s$" % (pattern_instance)
-    
-    def get_var_name(match):
-        if match.group('loose') is not None:
-            return match.group('loose')
-        else:
-            return match.group('tight')
-    
-    with open(in_filename, 'rU') as in_file:
-        with open(out_filename, 'w') as out_file:
-            for line in in_file:
-                match = re.search(pattern_entireline, line)
-                if match is not None:
-                    yield out_file, get_var_name(match), len(match.group('whitespace'))
-                else:
-                    start = 0
-                    for match in re.finditer(pattern_instance, line):
-                        out_file.write(line[start:match.start(0)])
-                        yield out_file, get_var_name(match), None
-                        start = match.end(0)
-                    out_file.write(line[start:])
-                    
\ No newline at end of file
+    segments = parse_template(in_filename)
+    out_file = StringIO()
+    for text, token, indent in segments:
+        if len(text) > 0:
+            out_file.write(text)
+        if token is not None:
+            yield out_file, token, indent
+            
+    contents = out_file.getvalue()
+    try:
+        with open(out_filename, 'r') as existing_file:
+            is_current = existing_file.read() == contents
+    except IOError:
+        is_current = False
+    if not is_current:
+        with open(out_filename, 'w') as real_out_file:
+            real_out_file.write(contents)
@@ -22,6 +22,7 @@ from ..Emitter.FileTemplate import FileTemplate
 from ..Emitter.PluginTemplate import TemplateToken
 from LanguagePlugins import rethrow_formatted
 import shutil
+import filecmp
 import os.path
 import os
 import sys
@@ -69,11 +70,19 @@ class Executor(object):
             
     def copy_files(self):
         """
-        Copy non-generated files into the output directory
+        Copy non-generated files into the output directory, skipping files 
+        which are already identical to the plugin's file
         """
         try:
             for file in self.language_plugin.get_files_to_copy():
-                shutil.copy(os.path.join(self.plugin_files_directory, file), os.path.join(self.output_directory, file))
+                source_file = os.path.join(self.plugin_files_directory, file)
+                destination_file = os.path.join(self.output_directory, file)
+                try:
+                    if filecmp.cmp(source_file, destination_file, shallow=False):
+                        continue
+                except OSError:
+                    pass
+                shutil.copy(source_file, destination_file)
         except Exception as e:
             rethrow_formatted(e, "while copying files")
             
@@ -20,13 +20,50 @@
 
 from ..Emitter.PluginTemplate import PluginTemplate
 import os.path
-import random
-import string
-import imp
+import errno
+import hashlib
 import sys
 import textwrap
 import types
 import Parser
+try:
+    import importlib.util
+except ImportError:
+    importlib = None
+    import imp
+
+def load_source(module_path, file_path):
+    """
+    Load a Python source file as a module. The file is opened only once, 
+    and compiled bytecode is cached where the interpreter supports it.
+    @param module_path: string containing the qualified name to give the module
+    @param file_path: string containing the path to the Python source file
+    @return: the loaded module object
+    """
+    if importlib is None:
+        return imp.load_source(module_path, file_path)
+    spec = importlib.util.spec_from_file_location(module_path, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_path] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[module_path]
+        raise
+    return module
+
+def get_module_path(prefix, file_path):
+    """
+    Build a module name which is unique to a source file, but the same each
+    time the file is loaded, so that repeated loads can reuse sys.modules.
+    @param prefix: string containing the start of the qualified module name
+    @param file_path: string containing the path to the Python source file
+    @return: string containing the qualified name to give the module
+    """
+    real_path = os.path.abspath(file_path)
+    if not isinstance(real_path, bytes):
+        real_path = real_path.encode('utf-8')
+    return prefix + hashlib.sha1(real_path).hexdigest()[:16]
 
 def rethrow_formatted(e, action):
     """
@@ -83,25 +120,39 @@ class Plugin(object):
         Loads the plug-in and verifies the interface
         """
         for dependency in self.dependencies:
-            with open(dependency, 'r') as f:
-                module_name = os.path.splitext(os.path.basename(dependency))[0]
-                path_template = "Generator.Emitter.language_plugin_dependency_%s_%s"
-                module_path = path_template % (module_name, ''.join(random.choice(string.ascii_lowercase) for i in range(8)))
-                self.dependency_modules[module_name] = imp.load_module(module_path, f, dependency, (".py", 'r', imp.PY_SOURCE))
-        with open(self.source_path, 'r') as f:
-            module_path = "Generator.Emitter.language_plugin_%s" % ''.join(random.choice(string.ascii_lowercase) for i in range(16))
-            self.module = imp.load_module(module_path, f, self.source_path, (".py", 'r', imp.PY_SOURCE))
+            module_name = os.path.splitext(os.path.basename(dependency))[0]
+            module_path = get_module_path("Generator.Emitter.language_plugin_dependency_%s_" % module_name, dependency)
+            self.dependency_modules[module_name] = self.load_file(module_path, dependency, "Dependency")
+        module_path = get_module_path("Generator.Emitter.language_plugin_", self.source_path)
+        self.module = self.load_file(module_path, self.source_path, "Source")
         if not hasattr(self.module, 'create_emitter') or not isinstance(self.module.create_emitter, types.FunctionType):
             raise Exception("Plug-in does not contain a 'create_emitter' function")
             
+    def load_file(self, module_path, file_path, description):
+        """
+        Loads a single Python source file belonging to the plug-in
+        @param module_path: string containing the qualified name to give the module
+        @param file_path: string containing the path to the Python source file
+        @param description: string describing the file, used in error messages
+        @return: the loaded module object
+        """
+        if module_path in sys.modules:
+            return sys.modules[module_path]
+        try:
+            return load_source(module_path, file_path)
+        except IOError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            raise Exception("{description} file '{path}' not found".format(description=description, path=file_path))
+            
     def create(self, lexical_analyzer, plugin_options):
         """
-        Creates a LanugageEmitter object from the plug-in
+        Creates a LanugageEmitter object from the plug-in, loading the plug-in first if necessary
         @param lexical_analyzer: The lexical analyzer in the specified representation
         @param plugin_options: A set of options passed in by the user.
         """
         if self.module is None:
-            raise Exception("Plug-in not loaded")
+            self.load()
         try:
             emitter = self.module.create_emitter(lexical_analyzer, self.dependency_modules, plugin_options)
         except Exception as e:
@@ -111,10 +162,17 @@ class Plugin(object):
         return emitter
                                         
 def describe(base_folder, file, encoding):
-    language_plugins, default_language = Parser.load(base_folder, file, encoding)
+    """
+    Prints a description of each plug-in in a plug-in file. Only the plug-in 
+    file is read; the plug-in sources are not loaded.
+    @param base_folder: string containing the directory against which file is resolved
+    @param file: a string specifying the plug-in specification file
+    @param encoding: a string specifying the encoding of the plug-in specification file
+    """
+    language_plugins, default_language = Parser.load(os.path.join(base_folder, file), encoding)
     left_column_size = len(max(language_plugins, key=lambda i: len(i))) + 1
     sys.stderr.write("Available output languages:\n")
-    for language, plugin in language_plugins.iteritems():
+    for language, plugin in language_plugins.items():
         paragraph = textwrap.wrap(plugin.description, 76-left_column_size)
         sys.stderr.write("    %s%s%s\n" % (language, ' '*(left_column_size-len(language)), paragraph[0]))
         if len(paragraph) > 1:
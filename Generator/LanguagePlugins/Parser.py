@@ -20,27 +20,33 @@
 
 import re
 import os.path
+import errno
 import json
 import LanguagePlugins
 
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+plugin_id_pattern = re.compile(r"\A[a-zA-Z][a-zA-Z0-9_\-\+]*\Z")
+
 def is_text(text):
     """
-    Simple utility function to determine if an object is of type str or unicode
+    Simple utility function to determine if an object is a string
     """
-    return isinstance(text, str) or isinstance(text, unicode)
+    return isinstance(text, string_types)
     
 def is_path(text, base_directory):
     """
-    Simple utility function to determine if the object is an str, and represents a valid path
+    Simple utility function to determine if the object is an str, and resolve it as a path. 
+    Whether the path exists is not checked here, but when the file is used.
     @return: a string with the resolved path, or None if not a path
     """
     if is_text(text):
         if not os.path.isabs(text):
-            path = os.path.join(base_directory, text)
-        else:
-            path = text
-        if os.path.exists(path):
-            return path
+            return os.path.join(base_directory, text)
+        return text
     return None
     
 def is_form(form):
@@ -54,6 +60,64 @@ def is_form(form):
         elif form.lower() == "nfa":
             return LanguagePlugins.PluginOptions.NFA_IR
     return None
+    
+def is_list(value, parse_item):
+    """
+    Simple utility function to determine if the object is a list, and parse each item in it.
+    @param parse_item: function which returns the parsed form of an item, or None if the item is invalid
+    @return: a list of parsed items, or None if not a list or if any item is invalid
+    """
+    if not isinstance(value, list):
+        return None
+    items = [parse_item(i) for i in value]
+    if any(i is None for i in items):
+        return None
+    return items
+    
+# Attributes of a plug-in entry. Each maps to a tuple with three items. The first is True if
+# the attribute is required. The second is a function taking the attribute's value and the
+# plug-in file's directory, and returning the parsed value, or None if the value is invalid.
+# The third describes a valid value, for error messages.
+plugin_entry_schema = {
+    "Source": (True, is_path, "a path"),
+    "Files": (True, is_path, "a path"),
+    "Dependencies": (False, lambda value, base_directory: is_list(value, lambda i: is_path(i, base_directory)), "a list of paths"),
+    "Description": (False, lambda value, base_directory: value if is_text(value) else None, "a string"),
+    "Forms": (False, lambda value, base_directory: is_list(value, is_form), "a list of forms, each either 'nfa' or 'dfa'"),
+    "DefaultForm": (False, lambda value, base_directory: is_form(value), "either 'nfa' or 'dfa'")
+}
+
+def parse_plugin_entry(plugin_id, plugin_entry, base_directory):
+    """
+    Validates a single plug-in entry against plugin_entry_schema in a single pass, 
+    and fills in defaults for optional attributes which are not present.
+    @param plugin_id: a string containing the plug-in's identifier, for error messages
+    @param plugin_entry: the object parsed from the plug-in's entry in the plug-in file
+    @param base_directory: a string containing the directory of the plug-in file
+    @return: dict mapping each attribute in plugin_entry_schema to its parsed value
+    """
+    if not isinstance(plugin_entry, dict):
+        raise Exception("Plugin '{id}' is not a dictionary".format(id=plugin_id))
+    parsed = {
+        "Dependencies": [],
+        "Description": "",
+        "Forms": [LanguagePlugins.PluginOptions.DFA_IR],
+        "DefaultForm": LanguagePlugins.PluginOptions.DFA_IR
+    }
+    for plugin_attr, value in plugin_entry.items():
+        if plugin_attr in plugin_entry_schema:
+            required, parse, expected = plugin_entry_schema[plugin_attr]
+            parsed[plugin_attr] = parse(value, base_directory)
+            if parsed[plugin_attr] is None:
+                raise Exception("Plugin '{id}' attribute '{attr}' must be {expected}".format(
+                    id=plugin_id, attr=plugin_attr, expected=expected))
+    for plugin_attr, (required, parse, expected) in plugin_entry_schema.items():
+        if required and plugin_attr not in parsed:
+            raise Exception("Plugin '{id}' is missing required attribute '{attr}'".format(id=plugin_id, attr=plugin_attr))
+    parsed["Forms"] = set(parsed["Forms"])
+    if parsed["DefaultForm"] not in parsed["Forms"]:
+        raise Exception("Plugin '{id}' default form is not one of its forms".format(id=plugin_id))
+    return parsed
 
 def load(file, encoding='utf-8'):
     """ 
@@ -64,10 +128,14 @@ def load(file, encoding='utf-8'):
     """
     language_plugins = {}
     default_language = None
-    if not os.path.exists(file):
-        raise Exception("Plugin file not found")
     base_directory = os.path.dirname(file)
-    with open(file) as f:
+    try:
+        f = open(file)
+    except IOError as e:
+        if e.errno != errno.ENOENT:
+            raise
+        raise Exception("Plugin file not found")
+    with f:
         plugin_file = json.load(f, encoding)
         if "Version" not in plugin_file or not isinstance(plugin_file["Version"], int) or plugin_file["Version"] != 1:
             raise Exception("Language plug-in file version not recognized")
@@ -77,54 +145,16 @@ def load(file, encoding='utf-8'):
         if "Plugins" not in plugin_file or not isinstance(plugin_file["Plugins"], dict):
             raise Exception("Plugin dictionary not found")
         for plugin_id in plugin_file["Plugins"]:
-            if is_text and re.match("[a-zA-Z][a-zA-Z0-9_\-\+]*", plugin_id):
-                valid = True
-                plugin_paths = {}
-                dependencies = []
-                description = ""
-                forms = [LanguagePlugins.PluginOptions.DFA_IR]
-                default_form = LanguagePlugins.PluginOptions.DFA_IR
-                for plugin_attr in plugin_file["Plugins"][plugin_id]:
-                    if is_text(plugin_attr) and plugin_attr in ("Source", "Files"):
-                        plugin_paths[plugin_attr] = is_path(plugin_file["Plugins"][plugin_id][plugin_attr], base_directory)
-                        if plugin_paths[plugin_attr] is None:
-                            valid = False
-                    elif plugin_attr == "Dependencies":
-                        raw_dependencies = plugin_file["Plugins"][plugin_id][plugin_attr]
-                        if not isinstance(raw_dependencies, list):
-                            valid = False
-                        dependencies = [is_path(i, base_directory) for i in raw_dependencies]
-                        if any(i is None for i in dependencies):   
-                            valid = False
-                    elif plugin_attr == "Description":
-                        if is_text(plugin_file["Plugins"][plugin_id][plugin_attr]):
-                            description = plugin_file["Plugins"][plugin_id][plugin_attr]
-                        else:
-                            valid = False
-                    elif plugin_attr == "Forms":
-                        pf_forms = plugin_file["Plugins"][plugin_id][plugin_attr]
-                        if isinstance(pf_forms, list):
-                            forms = set()
-                            for form in pf_forms:
-                                parsed_form = is_form(form)
-                                if parsed_form is not None:
-                                    forms.add(parsed_form)
-                    elif plugin_attr == "DefaultForm":
-                        pf_default_form = is_form(plugin_file["Plugins"][plugin_id][plugin_attr])
-                        if pf_default_form is not None:
-                            default_form = pf_default_form
-                if default_form not in forms:
-                    valid = False
-                if "Source" not in plugin_paths or "Files" not in plugin_paths:
-                    valid = False
-                if valid:
-                    language_plugins[plugin_id] = LanguagePlugins.Plugin(
-                        plugin_paths["Source"], 
-                        plugin_paths["Files"], 
-                        dependencies,
-                        description,
-                        forms,
-                        default_form)
+            if not is_text(plugin_id) or not plugin_id_pattern.match(plugin_id):
+                raise Exception("Plugin ID '{id}' is invalid".format(id=plugin_id))
+            parsed = parse_plugin_entry(plugin_id, plugin_file["Plugins"][plugin_id], base_directory)
+            language_plugins[plugin_id] = LanguagePlugins.Plugin(
+                parsed["Source"], 
+                parsed["Files"], 
+                parsed["Dependencies"],
+                parsed["Description"],
+                parsed["Forms"],
+                parsed["DefaultForm"])
        
         if len(language_plugins) == 0:
             raise Exception("No plugins found")
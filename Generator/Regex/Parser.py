@@ -499,8 +499,9 @@ class Parser(object):
         """
         self.expect("{")
         name = self.parse_unicode_word()
+        self.expect("}")
         coverage = UnicodeQuery.instance(self.unicode_db).query('na', name)
-        if coverage.empty():
+        if coverage.is_empty():
             raise ValueError("Name '{name}' not found".format(name=name))
         return coverage
         
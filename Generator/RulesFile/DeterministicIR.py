@@ -41,6 +41,8 @@ class DeterministicIR(object):
         @ivar exits: True if the state machine should return to the parent's state machine if the state machine is
             put into an error state on the first character
         @ivar parent: String containing a qualified section ID of the section's hierarchical parent
+        @ivar rule_priorities: A dictionary mapping each rule ID to the index of the rule in rules
+        @ivar capture_ids: A frozenset containing the ID of each rule with a 'capture' action
         """
         def accept(self, visitor):
             visitor.visit_section(self)
@@ -51,13 +53,25 @@ class DeterministicIR(object):
             self.inherits = inherits
             self.exits = exits
             self.parent = parent
+            self.rule_priorities = dict((rule.id, i) for i, rule in enumerate(rules))
+            self.capture_ids = frozenset(rule.id for rule in rules if 'capture' in rule.action)
             
         def get_matching_rule(self, state):
             """
             Given a state, return the highest priority rule which can end in that state
             @param state: A DeterministicState object which exists within the section's DFA
             """
-            return next((rule for rule in self.rules if rule.id in state.final_ids), None)
+            priorities = [self.rule_priorities[id] for id in state.final_ids if id in self.rule_priorities]
+            if len(priorities) == 0:
+                return None
+            return self.rules[min(priorities)]
+            
+        def is_capturing(self, state):
+            """
+            Given a state, return True if any capture rule can be completed from that state
+            @param state: A DeterministicState object which exists within the section's DFA
+            """
+            return not self.capture_ids.isdisjoint(state.ids)
             
     class Rule(object):
         """
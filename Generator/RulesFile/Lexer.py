@@ -171,6 +171,6 @@ class Lexer(object):
             match = Lexer._regex.match(self.source, index)
             if match is None:
                 self.throw("unrecognized syntax starting with '%s'" % self.source[index])
-            yield [(k, v) for k, v in match.groupdict().iteritems() if v is not None][0]
+            yield [(k, v) for k, v in match.groupdict().items() if v is not None][0]
             index = match.end()
             
\ No newline at end of file
@@ -20,6 +20,7 @@
 
 from Visitor import Visitor, Traverser
 from SectionResolver import SectionResolver
+from Lexer import RulesFileException
 from .. import Automata
 from .. import Regex
 from ..Common import lower_nullable
@@ -81,6 +82,8 @@ class NonDeterministicIR(object):
         AST node.
         @ivar sections: array of sections
         @ivar rule_ids: dictionary of case-insensitiv rule ID strings to case-sensitive rule ID strings
+        @ivar regex_cache: dictionary mapping tuples of a pattern string and its attributes to parsed regular expression objects
+        @ivar section_ids: dictionary mapping the object IDs of AST sections to their qualified names
         """
         def __init__(self):            
             self.current_ast_section = None
@@ -88,12 +91,29 @@ class NonDeterministicIR(object):
             self.sections = {}
             self.rule_ids = {}
             self.rule_hashes = list()
+            self.regex_cache = {}
+            self.section_ids = {}
+            
+        def get_section_id(self, section):
+            """
+            Return the qualified name of an AST section, building it from the
+            cached name of its parent so that each section is only named once.
+            @param section: an AST.Section object
+            @return: string representing the qualified name of the section
+            """
+            key = id(section)
+            if key not in self.section_ids:
+                if section.parent is None:
+                    self.section_ids[key] = section.get_qualified_name()
+                else:
+                    self.section_ids[key] = '.'.join((self.get_section_id(section.parent), section.id))
+            return self.section_ids[key]
                     
         def visit_section(self, section):
             self.current_ast_section = section
-            parent_id = section.parent.get_qualified_name() if section.parent is not None else None
+            parent_id = self.get_section_id(section.parent) if section.parent is not None else None
             self.current_ir_section = NonDeterministicIR.Section(inherits=section.inherits, exits=section.exits, parent=parent_id)
-            self.sections[self.current_ast_section.get_qualified_name()] = self.current_ir_section
+            self.sections[self.get_section_id(section)] = self.current_ir_section
             self.rule_hashes.append(set())
             
         def leave_section(self, section):
@@ -102,16 +122,72 @@ class NonDeterministicIR(object):
             """
             self.current_ast_section = section.parent
             if self.current_ast_section is not None:
-                self.current_ir_section = self.sections[section.parent.get_qualified_name()]
+                self.current_ir_section = self.sections[self.get_section_id(section.parent)]
             else:
                 self.current_ir_section = None
             self.rule_hashes.pop()
+            
+        def parse_regex(self, regex, is_case_insensitive, is_unicode_defaults=False, is_literal=False):
+            """
+            Parse a regular expression string, reusing the result if the same pattern
+            was already parsed with the same attributes. Parsed expressions are only 
+            read by the NFA builder and variable resolver, so they can be shared.
+            @param regex: string containing the regular expression
+            @param is_case_insensitive: boolean which is true if the regular expression should be case insensitive
+            @param is_unicode_defaults: boolean which is true if special characters and classes should use Unicode equivalents
+            @param is_literal: boolean which is true if all characters in the pattern are literal
+            @return: a visitable regular expression object from the Regex package
+            """
+            key = (regex, is_case_insensitive, is_unicode_defaults, is_literal)
+            if key not in self.regex_cache:
+                self.regex_cache[key] = Regex.Parser(regex, is_case_insensitive, is_unicode_defaults, is_literal).parse()
+            return self.regex_cache[key]
         
         def visit_rule(self, rule):
             """
             Resolve section references and variables, compile the rule
             into an NFA, and add to the currently visited section.
             """
+            if 'reserve' in rule.rule_action:
+                return
+                
+            rule_id_lower = lower_nullable(rule.id)
+            action, section = rule.section_action
+            nfa_id = hash(rule)
+            try:
+                nfa = self.build_rule(rule, nfa_id)
+                if section is not None:
+                    rule_section = SectionResolver.resolve(section, self.current_ast_section)
+            except (Regex.RegexParserExceptionInternal, RulesFileException, ValueError) as e:
+                if getattr(e, 'is_sealed', False):
+                    raise
+                self.throw_rule_error(rule, str(e))
+            if section is not None:
+                if rule_section is None:
+                    self.throw_rule_error(rule, "section '{id}' not found".format(id=section.name))
+                section = self.get_section_id(rule_section)
+            section_action = (action, section)
+            ir_rule = NonDeterministicIR.Rule(rule.id, nfa_id, nfa, rule.rule_action, section_action, rule.line_number)
+            if nfa_id in self.rule_hashes[-1]:
+                # Merge identical rules if already exists
+                existing_rule = next((r for r in self.current_ir_section.rules if r.id == nfa_id), None)
+                existing_rule.nfa = nfa.alternate((existing_rule.nfa, nfa))
+            else:
+                # Otherwise, add the rule to the set
+                self.current_ir_section.rules.append(ir_rule)
+                self.rule_hashes[-1].add(nfa_id)
+            if rule_id_lower not in self.rule_ids:
+                self.rule_ids[rule_id_lower] = rule.id
+                
+        def build_rule(self, rule, nfa_id):
+            """
+            Parse a rule's pattern and compile it into an NFA, resolving variables
+            from the scope of the currently visited section.
+            @param rule: the AST Rule object to compile
+            @param nfa_id: the ID to give the final state of the NFA
+            @return: a NonDeterministicFinite object representing the rule's pattern
+            """
+            builder = self
             current_ast_section = self.current_ast_section
             class DefineLookup(object):
                 """
@@ -123,47 +199,26 @@ class NonDeterministicIR(object):
                 def __getitem__(self, item_name):
                     result = current_ast_section.find('define', item_name)
                     if result is None:
-                        raise Exception("variable '{id}' not found".format(id=item_name))
+                        raise Regex.RegexParserUndefinedVariable(item_name)
                     try:
-                        return Regex.Parser(result[0].pattern.regex, result[0].pattern.attributes.is_case_insensitive).parse() 
-                    except Exception as e:
+                        return builder.parse_regex(result[0].pattern.regex, result[0].pattern.attributes.is_case_insensitive)
+                    except (Regex.RegexParserExceptionInternal, ValueError) as e:
                         result[0].pattern.throw(str(e), is_sealed=True)
-                
-            try:
-                if 'reserve' not in rule.rule_action:
-                    rule_id_lower = lower_nullable(rule.id)
-                    action, section = rule.section_action
-                    nfa_id = hash(rule)
-                    attributes = rule.pattern.attributes
-                    regex = Regex.Parser(rule.pattern.regex, attributes.is_case_insensitive, attributes.is_unicode_defaults, attributes.is_literal).parse()
-                    nfa = Automata.NonDeterministicFiniteBuilder.build(nfa_id, DefineLookup(), regex)
-                    section_action = None
-                    if section is not None:
-                        rule_section = SectionResolver.resolve(section, self.current_ast_section)
-                        if rule_section is None:
-                            raise Exception("section '{id}' not found".format(id=section.name))
-                        section = rule_section.get_qualified_name()
-                    section_action = (action, section)
-                    ir_rule = NonDeterministicIR.Rule(rule.id, nfa_id, nfa, rule.rule_action, section_action, rule.line_number)
-                    if nfa_id in self.rule_hashes[-1]:
-                        # Merge identical rules if already exists
-                        rule = next((r for r in self.current_ir_section.rules if r.id == nfa_id), None)
-                        rule.nfa = nfa.alternate((rule.nfa, nfa))
-                        self.current_ir_section.rules
-                    else:
-                        # Otherwise, add the rule to the set
-                        self.current_ir_section.rules.append(ir_rule)
-                        self.rule_hashes[-1].add(nfa_id)
-                    if rule_id_lower not in self.rule_ids:
-                        self.rule_ids[rule_id_lower] = rule.id
                         
-            except Exception as e:
-                if getattr(e, 'is_sealed', False):
-                    raise
-                if rule.id is None:
-                    rule.throw("anonymous rule: {message}".format(message=str(e)))
-                else:
-                    rule.throw("rule '{id}': {message}".format(id=rule.id, message=str(e)))
+            attributes = rule.pattern.attributes
+            regex = self.parse_regex(rule.pattern.regex, attributes.is_case_insensitive, attributes.is_unicode_defaults, attributes.is_literal)
+            return Automata.NonDeterministicFiniteBuilder.build(nfa_id, DefineLookup(), regex)
+            
+        def throw_rule_error(self, rule, message):
+            """
+            Raise an error for a rule, identifying the rule in the message
+            @param rule: the AST Rule object which caused the error
+            @param message: string describing the error
+            """
+            if rule.id is None:
+                rule.throw("anonymous rule: {message}".format(message=message))
+            else:
+                rule.throw("rule '{id}': {message}".format(id=rule.id, message=message))
                 
         def get(self):
             """
@@ -22,7 +22,6 @@ import os
 import os.path
 import re
 import sys
-import StringIO
 import collections
 import itertools
 from EmitCode import CodeEmitter
@@ -35,13 +34,14 @@ def create_emitter(lexical_analyzer, dependencies, plugin_options):
 class CPlusPlusEmitter(PluginTemplate):
     """
     Emits a lexical analyzer as C++ source code.
+    @ivar rule_ids: sorted list of strings, each containing the ID of a rule which returns a token
     """
-    reserved_keywords = [
+    reserved_keywords = set([
         'auto', 'bool', 'break', 'case', 'char', 'class' 'const', 'continue', 'default', 'do',
         'double', 'else', 'enum', 'extern', 'float', 'for', 'goto', 'if', 
         'int', 'long', 'register', 'return', 'short', 'signed', 'sizeof', 'static',
         'std', 'struct', 'switch', 'typedef', 'union', 'unsigned', 'void', 'volatile', 'while'
-    ]
+    ])
     h_file = "lexical_analyzer.h"
     cpp_file = "lexical_analyzer.cpp"
     demo_file = os.path.join('demo', 'demo.cpp')
@@ -50,6 +50,8 @@ class CPlusPlusEmitter(PluginTemplate):
     default_namespace = "Poodle"
     default_class_name = "LexicalAnalyzer"
     default_file_name = "LexicalAnalyzer"
+    identifier_pattern = re.compile(r"\A[A-Za-z_][A-Za-z0-9_]*\Z")
+    namespace_pattern = re.compile(r"\A[A-Za-z_][A-Za-z0-9_]*(::[A-Za-z_][A-Za-z0-9_]*)*\Z")
     
     def __init__(self, dfa_ir, dependencies, plugin_options):
         """
@@ -58,17 +60,18 @@ class CPlusPlusEmitter(PluginTemplate):
         @param plugin_options: LanguagePlugins.PluginOptions object containing options which affect the generation of code.
         """
         self.dfa_ir = dfa_ir
+        self.rule_ids = sorted(rule for rule in dfa_ir.rule_ids.values() if rule is not None)
         self.plugin_options = plugin_options
         self.VariableFormatter = dependencies["VariableFormatter"].VariableFormatter
         self.StateMachineEmitter = dependencies["StateMachine"].StateMachineEmitter
         
         # Process plugin options
-        for name, description in [
-            (plugin_options.file_name, 'Base file name'),
-            (plugin_options.namespace, 'Namespace')
+        for name, description, pattern in [
+            (plugin_options.file_name, 'Base file name', CPlusPlusEmitter.identifier_pattern),
+            (plugin_options.namespace, 'Namespace', CPlusPlusEmitter.namespace_pattern)
         ]:
             if name is not None:
-                if re.match("[A-Za-z_][A-Za-z0-9_]*", name) is None:
+                if pattern.match(name) is None:
                     raise Exception("Invalid %s '%s'" % (description.lower(), name))
                 elif name in CPlusPlusEmitter.reserved_keywords:
                     raise Exception("%s '%s' is reserved" % (description, name))
@@ -112,16 +115,9 @@ class CPlusPlusEmitter(PluginTemplate):
         elif token.token == 'CLASS_NAME':
             token.stream.write(self.class_name)
         elif token.token == 'ENUM_TOKEN_IDS':
-            ids = sorted(rule for rule in self.dfa_ir.rule_ids.values() if rule is not None)
-            ids.insert(0, 'invalidcharacter')
-            ids.insert(0, 'endofstream')
-            ids.insert(0, 'skippedtoken')
-            for i, id in enumerate(ids):
-                id_key = self.formatter.get_token_id(id)
-                if i != len(ids)-1:
-                    token.stream.write('{indent}{id},\n'.format(indent=' '*token.indent, id=id_key))
-                else:
-                    token.stream.write('{indent}{id}\n'.format(indent=' '*token.indent, id=id_key))
+            ids = ['skippedtoken', 'endofstream', 'invalidcharacter'] + self.rule_ids
+            code = CodeEmitter(token.stream, token.indent)
+            code.line(',\n'.join(self.formatter.get_token_id(id) for id in ids))
         elif token.token == 'ENUM_SECTION_IDS':
             code = CodeEmitter(token.stream, token.indent)
             code.line()
@@ -129,12 +125,7 @@ class CPlusPlusEmitter(PluginTemplate):
                 code.line('enum Mode');
                 with code.block('{', '};'):
                     ids = sorted(self.dfa_ir.sections)
-                    for i, id in enumerate(ids):
-                        formatted = self.formatter.get_section_id(id)
-                        if i == len(ids)-1:
-                            code.line(formatted)
-                        else:
-                            code.line('{id},'.format(id=formatted))
+                    code.line(',\n'.join(self.formatter.get_section_id(id) for id in ids))
                 code.line()
         elif token.token == 'HEADER_GUARD':
             token.stream.write("{namespace}_{basefile}_H".format(
@@ -161,9 +152,8 @@ class CPlusPlusEmitter(PluginTemplate):
                     indent = ' '*token.indent,
                     initial_mode = self.formatter.get_section_id('::main::')))
         elif token.token == 'SELECT_ID_STRING':
-            ids = sorted(rule for rule in self.dfa_ir.rule_ids.values() if rule is not None)
             code = CodeEmitter(token.stream, token.indent)
-            for id in ids:
+            for id in self.rule_ids:
                 with code.block('case {class_name}::Token::{token_id}:'.format(   
                     class_name=self.class_name,
                     token_id=self.formatter.get_token_id(id))):
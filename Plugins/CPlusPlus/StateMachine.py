@@ -19,6 +19,14 @@
 # DEALINGS IN THE SOFTWARE.
 
 class StateMachineEmitter(object):
+    """
+    Emits the state machine for a single section as a C++ method
+    @cvar jump_table_size: the number of characters, starting at 0, covered by a state's jump table
+    @cvar jump_table_threshold: the minimum number of ASCII ranges a state must transition on to use a jump table
+    """
+    jump_table_size = 128
+    jump_table_threshold = 12
+    
     def __init__(self, dfa_ir, section_id, formatter, emitter):
         self.section_id = section_id
         self.dfa_ir = dfa_ir
@@ -43,6 +51,8 @@ class StateMachineEmitter(object):
         self.add_state_id = self.state_id_formatter.add_state_id
         self.add_state_id(self.start_state, "INITIAL_STATE")
         self.add_state_id('invalid_char_state', 'INVALID_CHAR_STATE')
+        self.add_state_id('no_transition', 'NO_TRANSITION')
+        self.jump_tables = self.get_jump_tables()
 
 
     def emit_state_machine(self):
@@ -52,6 +62,7 @@ class StateMachineEmitter(object):
             method_name = self.formatter.get_state_machine_method_name(section_id, is_relative=False)))
         with self.block("{", "}"):
             self.emit_state_enum()
+            self.emit_jump_tables()
             self.emit([
                 '{token_type} token;'.format(
                     token_type = self.formatter.get_type('token', is_relative=False)),
@@ -78,14 +89,56 @@ class StateMachineEmitter(object):
         self.line("enum State")
         with self.block("{", "};"):
             ids = [self.get_state_id(state) for state in self.dfa]
-            ids.insert(0, "INVALID_CHAR_STATE")
-            for i, id in enumerate(sorted(ids)):
-                if i != 0:
-                    self.emitter.write(",")
-                    self.emitter.close_line()
-                self.emitter.open_line()
-                self.emitter.write(id)
-            self.emitter.close_line()
+            ids.insert(0, self.get_state_id('invalid_char_state'))
+            if len(self.jump_tables) > 0:
+                ids.insert(0, self.get_state_id('no_transition'))
+            self.line(",\n".join(sorted(ids)))
+    
+    def get_jump_tables(self):
+        """
+        Build a table of ASCII transitions for each state which transitions on enough 
+        ASCII ranges that a single indexed lookup is cheaper than a chain of comparisons.
+        @return: dict mapping DeterministicState objects to tuples with two items. The first 
+            is a list of destination states indexed by character, with None where there is 
+            no transition. The second is a dict mapping destination states to lists of ranges
+            outside of the table which lead to them.
+        """
+        size = self.jump_table_size
+        jump_tables = {}
+        for state in self.dfa:
+            table = [None]*size
+            other_edges = {}
+            n_ranges = 0
+            for destination, edges in state.edges.items():
+                for min_v, max_v in edges:
+                    if min_v < size:
+                        n_ranges += 1
+                        table_max = min(max_v, size-1)
+                        table[min_v:table_max+1] = [destination]*(table_max+1-min_v)
+                    if max_v >= size:
+                        other_edges.setdefault(destination, []).append((max(min_v, size), max_v))
+            if n_ranges >= self.jump_table_threshold:
+                jump_tables[state] = (table, other_edges)
+        return jump_tables
+        
+    def get_jump_table_name(self, state):
+        return 'transitions_{id}'.format(id=self.get_state_id(state).lower())
+        
+    def emit_jump_tables(self):
+        state_type = self.formatter.get_type('state', is_relative=False)
+        for state in self.dfa:
+            if state not in self.jump_tables:
+                continue
+            table, other_edges = self.jump_tables[state]
+            ids = [self.get_state_id(i if i is not None else 'no_transition') for i in table]
+            self.line("static const {state_type} {name}[{size}] =".format(
+                state_type = state_type,
+                name = self.get_jump_table_name(state),
+                size = self.jump_table_size))
+            with self.block("{", "};"):
+                for i in range(0, len(ids), 8):
+                    separator = "," if i + 8 < len(ids) else ""
+                    self.line(", ".join(ids[i:i+8]) + separator)
     
     def emit_state_machine_cases(self):
         self.emit_invalid_char_case()
@@ -98,23 +151,30 @@ class StateMachineEmitter(object):
             
     def emit_state(self, state):
         # Capture a character if there is a possibility of completing a capture rule
-        capture = False
-        for rule in self.section.rules:
-            if rule.id in state.ids and 'capture' in rule.action:
-                self.line("capture = true;")
-                break
+        if self.section.is_capturing(state):
+            self.line("capture = true;")
 
         if len(state.edges) > 0:
             # Transition table
-            state_edges = iter(state.edges.items())
+            statement = "if"
+            state_edges = state.edges.items()
             if state == self.dfa.start_state:
                 with self.block("if (c == -1)"):
                     self.line("return Token(Token::{token_id});".format(token_id=self.formatter.get_token_id('endofstream')))
-            elif len(state.edges) > 0:
-                destination, edges = state_edges.next()
-                self.emit_transition("if", destination, edges)
+                statement = "else if"
+            if state in self.jump_tables:
+                table, other_edges = self.jump_tables[state]
+                with self.block("{statement} (c >= 0 && c < {size} && {table}[c] != {no_transition})".format(
+                    statement = statement,
+                    size = self.jump_table_size,
+                    table = self.get_jump_table_name(state),
+                    no_transition = self.get_state_id('no_transition'))):
+                    self.line("state = {table}[c];".format(table=self.get_jump_table_name(state)))
+                statement = "else if"
+                state_edges = other_edges.items()
             for destination, edges in state_edges:
-                self.emit_transition("else if", destination, edges)
+                self.emit_transition(statement, destination, edges)
+                statement = "else if"
             self.line("else")    
             self.emit_else_case(state, is_in_if=True)
         else:
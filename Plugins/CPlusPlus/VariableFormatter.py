@@ -29,16 +29,14 @@ class StateIdFormatter(object):
     def __init__(self, rules, reserved_ids):
         def state_id_formatter(state):
             state_id = 'STATE_'
-            for rule in self.rules:
-                if rule.id in state.ids:
-                    if rule.name is None:
-                        state_id += '_ANONYMOUS'
-                    else:
-                        state_id += '_' + rule.name.upper()
+            for rule_id, rule_name in self.rule_names:
+                if rule_id in state.ids:
+                    state_id += rule_name
             return state_id
         self.cache = CachedFormatter(limit=512, reserved=reserved_ids)
         self.cache.add_cache('state_id', state_id_formatter)
         self.rules = rules
+        self.rule_names = [(rule.id, '_ANONYMOUS' if rule.name is None else '_' + rule.name.upper()) for rule in rules]
         for attr in dir(self.cache):
             if any(attr.startswith(i) for i in ('get_', 'add_', 'clear_')):
                 setattr(self, attr, getattr(self.cache, attr))
@@ -160,7 +160,7 @@ class DotPlugin(PluginTemplate):
     def format_codepoint(codepoint):
         if codepoint == ord('"'):
             return "'\\\"'"
-        if codepoint in xrange(32, 127):
+        if 32 <= codepoint < 127:
             return "'%s'" % chr(codepoint).replace("\\", "\\\\")
         else:
             return "0x%x" % codepoint
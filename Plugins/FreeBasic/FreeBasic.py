@@ -22,7 +22,6 @@ import os
 import os.path
 import re
 import sys
-import StringIO
 import collections
 import itertools
 import copy
@@ -38,6 +37,7 @@ class FreeBasicEmitter(PluginTemplate):
     Emits a lexical analyzer as FreeBasic source code.
     @ivar lexical_analyzer: the lexical analyzer to emit
     @ivar ids: a dict mapping states to an enum element in the FreeBasic source
+    @ivar rule_ids: sorted list of strings, each containing the name of a token, including SkippedToken
     @ivar dfa: the deterministic finite automata (DFA) representing the lexical analyzer.
     """
     reserved_keywords = set([
@@ -125,6 +125,7 @@ class FreeBasicEmitter(PluginTemplate):
     default_class_name = "LexicalAnalyzer"
     poodle_namespace = "Poodle"
     default_namespace = poodle_namespace
+    identifier_pattern = re.compile(r"\A[A-Za-z_][A-Za-z0-9_]*\Z")
     
     def __init__(self, lexical_analyzer, dependencies, plugin_options):
         """
@@ -137,7 +138,7 @@ class FreeBasicEmitter(PluginTemplate):
         self.VariableFormatter = dependencies["VariableFormatter"].VariableFormatter
         self.StateMachineEmitter = dependencies["StateMachine"].StateMachineEmitter
         self.ids = {}
-        self.rule_ids = {}
+        self.rule_ids = sorted([id for id in lexical_analyzer.rule_ids.values() if id is not None] + ['SkippedToken'])
         self.dfa = None
 
         # Process plugin options
@@ -147,7 +148,7 @@ class FreeBasicEmitter(PluginTemplate):
             (plugin_options.namespace, 'Namespace')
         ]:
             if name is not None:
-                if re.match("[A-Za-z_][A-Za-z0-9_]*", name) is None:
+                if FreeBasicEmitter.identifier_pattern.match(name) is None:
                     raise Exception("Invalid {object} '{name}'".format(object=description.lower(), name=name))
                 elif name.lower() in FreeBasicEmitter.reserved_keywords:
                     raise Exception("{object} '{name}' is reserved".format(object=description, name=name))
@@ -235,9 +236,7 @@ class FreeBasicEmitter(PluginTemplate):
                 code.line(x)
         elif token.token == 'ENUM_TOKEN_IDS':
             code = CodeEmitter(token.stream, token.indent)
-            rules = [id for id in self.lexical_analyzer.rule_ids.values() if id is not None]
-            rules.append('SkippedToken')
-            for rule in sorted(rules):
+            for rule in self.rule_ids:
                 code.line(self.formatter.get_token_id(rule))
         elif token.token == 'HEADER_GUARD_NAME':
             token.stream.write('{namespace}_{class_name}_BI'.format(
@@ -287,12 +286,7 @@ class FreeBasicEmitter(PluginTemplate):
                 emitter.generate_state_machine()
         elif token.token == 'TOKEN_IDNAMES':
             code = CodeEmitter(token.stream, token.indent)
-            filtered_ids = [rule_id for rule_id in self.lexical_analyzer.rule_ids.values() if rule_id is not None]
-            filtered_ids.append('SkippedToken')
-            for i, rule in enumerate(sorted(filtered_ids)):
-                template = '@"{name}"'.format(name=rule)
-                template += ", _" if i < len(filtered_ids)-1 else " _"
-                code.line(template.format(name=rule))
+            code.line(', _\n'.join('@"{name}"'.format(name=rule) for rule in self.rule_ids) + ' _')
         elif token.token == 'TOKEN_IDNAMES_LIMIT':
             token.stream.write(str(len(self.lexical_analyzer.rule_ids)+2))
         elif token.token.startswith('TYPE_REL_'):
@@ -151,22 +151,20 @@ class StateMachineEmitter(object):
         found_zero = False
         
         # Emit transition table
-        for destination, edges in state.edges.iteritems():
+        for destination, edges in state.edges.items():
             self.line("Case %s" % ", ".join([self.format_case(i) for i in edges]))
             if not any(destination.edges) and len(destination.final_ids) > 0:
                 # Special case - if next state is a sink then just return the token.
-                rules = [rule for rule in self.rules if rule.id in destination.ids]
-                if any('capture' in rule.action for rule in rules):
+                if self.section.is_capturing(destination):
                     self.line("Capture = 1")
                 self.generate_token_return_case(destination, return_using_flag=True)
             else:
                 if state == self.start_state:
-                    if 0 in zip(*iter(edges))[0]:
+                    if any(min_v == 0 for min_v, max_v in edges):
                         # Since 0 could mean either end of stream or a binary zero, use IsEndOfStream() to determine
                         found_zero = True
                         self.generate_check_zero_or_eof(invalid_otherwise=False)
-                rules = [rule for rule in self.rules if rule.id in destination.ids]
-                if any('capture' in rule.action for rule in rules):
+                if self.section.is_capturing(destination):
                     self.line("Capture = 1")
                 self.line("State = {scope}.{state_id}".format(scope="StateMachineState", state_id=self.get_state_id(destination)))
                 self.line()
@@ -25,13 +25,14 @@ class StateIdFormatter(object):
     def __init__(self, rules, reserved_ids):
         def state_id_formatter(state):
             state_id = ''
-            for rule in self.rules:
-                if rule.id in state.ids:    
-                    state_id += rule.name if rule.name is not None else 'Anonymous'
+            for rule_id, rule_name in self.rule_names:
+                if rule_id in state.ids:    
+                    state_id += rule_name
             return state_id
         self.cache = CachedFormatter(limit=64, reserved=reserved_ids)
         self.cache.add_cache('state_id', state_id_formatter)
         self.rules = rules
+        self.rule_names = [(rule.id, rule.name if rule.name is not None else 'Anonymous') for rule in rules]
         for attr in dir(self.cache):
             if any(attr.startswith(i) for i in ('get_', 'add_', 'clear_')):
                 setattr(self, attr, getattr(self.cache, attr))
@@ -47,6 +48,7 @@ class VariableFormatter(object):
             
         self.poodle_namespace = poodle_namespace
         self.plugin_options = plugin_options
+        self.unicode_char_prefix = "{namespace}_UCS_".format(namespace=plugin_options.namespace.upper())
         self.reserved_ids = reserved_ids
         self.cache = CachedFormatter(limit=64, reserved=reserved_ids)
         self.cache.add_cache('section_id', section_id_formatter, cache_name='section_and_tokens')
@@ -115,8 +117,6 @@ class VariableFormatter(object):
     def get_unicode_char_name(self, codepoint):
         try:
             unicode_name = unicodedata.name(unichr(codepoint)).replace(' ', '_').replace('-', '_')
-            return "{namespace}_UCS_{name}".format(
-                namespace = self.get_namespace().upper(),
-                name = unicode_name.upper())[:64]
+            return (self.unicode_char_prefix + unicode_name.upper())[:64]
         except ValueError:
             return "&h%02x" % codepoint
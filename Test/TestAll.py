@@ -2,12 +2,18 @@ import sys
 import unittest
 import RulesFile
 from TestCExample import *
+from TestCPlusPlusJumpTables import *
+from TestCachedFormatter import *
 from TestCoverageSet import *
 from TestDFAEquivalency import *
 from TestDFAMinimization import *
+from TestExecutor import *
+from TestFileTemplate import *
 from TestLexicalAnalyzer import *
+from TestPluginFile import *
 from TestRegexParsing import *
 from TestRegexVariableResolver import *
+from TestRuleErrors import *
 #from RulesFile.TestParser import *
 #from RulesFile.TestValidator import *
 #from RulesFile.TestNonDeterministicIR import *
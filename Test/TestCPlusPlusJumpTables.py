@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.append("..")
+import unittest
+from StringIO import StringIO
+from Generator import RulesFile
+from Generator import LanguagePlugins
+from Generator.Emitter.EmitCode import CodeEmitter
+
+class TestCPlusPlusJumpTables(unittest.TestCase):
+    def setUp(self):
+        base_directory = os.path.realpath("..")
+        plugins, default_plugin = LanguagePlugins.load(os.path.join(base_directory, "Plugins", "Plugins.json"))
+        self.plugin = plugins['cpp']
+        self.plugin.load()
+        self.threshold = self.plugin.dependency_modules["StateMachine"].StateMachineEmitter.jump_table_threshold
+        
+    def build(self, text):
+        rules_file = RulesFile.Parser.parse_stream(StringIO(text))
+        rules_file.accept(RulesFile.Traverser(RulesFile.Validator()))
+        dfa_ir = RulesFile.DeterministicIR(RulesFile.NonDeterministicIR(rules_file))
+        emitter = self.plugin.create(dfa_ir, LanguagePlugins.PluginOptions())
+        stream = StringIO()
+        state_machine = emitter.StateMachineEmitter(dfa_ir, '::main::', emitter.formatter, CodeEmitter(stream))
+        return state_machine, stream
+        
+    def test_span_boundary(self):
+        # 12 isolated ASCII ranges plus one range crossing into non-ASCII
+        state_machine, stream = self.build("Foo: '[acegikmoqsuw\\x7e-\\u0200]'\n")
+        self.assertIn(state_machine.start_state, state_machine.jump_tables)
+        table, other_edges = state_machine.jump_tables[state_machine.start_state]
+        foo, = state_machine.start_state.edges.keys()
+        self.assertEqual(state_machine.get_state_id(foo), "STATE__FOO")
+        self.assertEqual(len(table), state_machine.jump_table_size)
+        for c in "acegikmoqsuw\x7e\x7f":
+            self.assertIs(table[ord(c)], foo)
+        for c in "bdfvx\x00\x7d":
+            self.assertIsNone(table[ord(c)])
+        self.assertEqual(other_edges, {foo: [(128, 0x200)]})
+        
+    def build_ranges(self, n_ranges):
+        # Every other character from '!', so that no two ranges are adjacent
+        characters = "".join("\\x{0:02x}".format(0x21 + 2*i) for i in range(n_ranges))
+        return self.build("Foo: '[{0}]'\n".format(characters))
+        
+    def test_threshold(self):
+        # One range fewer than the threshold falls back to comparisons
+        state_machine, stream = self.build_ranges(self.threshold - 1)
+        self.assertNotIn(state_machine.start_state, state_machine.jump_tables)
+        
+        state_machine, stream = self.build_ranges(self.threshold)
+        self.assertIn(state_machine.start_state, state_machine.jump_tables)
+        
+    def test_start_state_chaining(self):
+        # The end of stream check comes first, so the jump table is an "else if"
+        state_machine, stream = self.build("Foo: '[acegikmoqsuw\\x7e-\\u0200]'\n")
+        state_machine.emit_state(state_machine.start_state)
+        lines = [line.strip() for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines[0], "if (c == -1)")
+        self.assertEqual(lines[2], "else if (c >= 0 && c < 128 && transitions_initial_state[c] != NO_TRANSITION)")
+        self.assertEqual(lines[3], "state = transitions_initial_state[c];")
+        self.assertEqual(lines[4], "else if ((c >= 128 && c <= 512))")
+        self.assertEqual(lines[5], "state = STATE__FOO;")
+        self.assertEqual(lines[6], "else")
@@ -0,0 +1,48 @@
+import sys
+sys.path.append("..")
+import unittest
+from Generator.Emitter.CachedFormatter import CachedFormatter
+
+class TestCachedFormatter(unittest.TestCase):
+    def create(self, limit=64, reserved=[]):
+        formatter = CachedFormatter(limit=limit, reserved=reserved)
+        formatter.add_cache('name', lambda key: key[0])
+        return formatter
+        
+    def test_repeated_duplicates(self):
+        formatter = self.create()
+        names = [formatter.get_name(("foo", i)) for i in range(5)]
+        self.assertEqual(names, ["foo", "foo1", "foo2", "foo3", "foo4"])
+        
+        # Names are cached per key, and compared caselessly
+        self.assertEqual(formatter.get_name(("foo", 2)), "foo2")
+        self.assertEqual(formatter.get_name(("FOO", 0)), "FOO5")
+        
+        # A suffixed name taken by another value is skipped
+        formatter.add_name(("other", 0), "bar1")
+        self.assertEqual(formatter.get_name(("bar", 0)), "bar")
+        self.assertEqual(formatter.get_name(("bar", 1)), "bar2")
+        
+    def test_limit(self):
+        formatter = self.create(limit=4)
+        self.assertEqual(formatter.get_name(("abcdef", 0)), "abcd")
+        self.assertEqual(formatter.get_name(("abcdef", 1)), "abc1")
+        names = [formatter.get_name(("abcdef", i)) for i in range(2, 12)]
+        self.assertEqual(names[-3:], ["abc9", "ab10", "ab11"])
+        self.assertTrue(all(len(name) <= 4 for name in names))
+        
+    def test_reserved(self):
+        # Reserved names are compared caselessly and suffixed like duplicates
+        formatter = self.create(reserved=["Auto", "while"])
+        self.assertEqual(formatter.get_name(("auto", 0)), "auto1")
+        self.assertEqual(formatter.get_name(("WHILE", 0)), "WHILE1")
+        self.assertEqual(formatter.get_name(("while", 1)), "while2")
+        self.assertEqual(formatter.get_name(("autowhile", 0)), "autowhile")
+        
+    def test_clear(self):
+        formatter = self.create()
+        formatter.get_name(("foo", 0))
+        formatter.get_name(("foo", 1))
+        formatter.clear_names()
+        self.assertEqual(formatter.get_name(("foo", 1)), "foo")
+        self.assertEqual(formatter.get_name(("foo", 0)), "foo1")
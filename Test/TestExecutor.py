@@ -0,0 +1,88 @@
+import sys
+sys.path.append("..")
+import os
+import os.path
+import shutil
+import tempfile
+import unittest
+from Generator import LanguagePlugins
+from Generator.Emitter.PluginTemplate import PluginTemplate
+
+class TestPlugin(PluginTemplate):
+    """
+    Plug-in which copies one file and generates one file, substituting $NAME
+    """
+    def __init__(self, name):
+        self.name = name
+        
+    def process(self, token):
+        token.stream.write(self.name)
+        
+    def get_output_directories(self):
+        return []
+        
+    def get_files_to_copy(self):
+        return ["copied.txt"]
+        
+    def get_files_to_generate(self):
+        return [("template.txt", "generated.txt")]
+
+class TestExecutor(unittest.TestCase):
+    def setUp(self):
+        self.plugin_directory = tempfile.mkdtemp()
+        self.output_directory = tempfile.mkdtemp()
+        self.write(self.plugin_directory, "copied.txt", "support file")
+        self.write(self.plugin_directory, "template.txt", "Hello, $NAME!")
+        
+    def tearDown(self):
+        shutil.rmtree(self.plugin_directory)
+        shutil.rmtree(self.output_directory)
+        
+    def write(self, directory, file_name, contents, mtime=None):
+        path = os.path.join(directory, file_name)
+        with open(path, 'w') as f:
+            f.write(contents)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        
+    def read(self, file_name):
+        with open(os.path.join(self.output_directory, file_name)) as f:
+            return f.read()
+            
+    def execute(self, name):
+        LanguagePlugins.Executor(TestPlugin(name), self.plugin_directory, self.output_directory).execute()
+            
+    def age_outputs(self):
+        # Backdate the outputs so that any rewrite is visible in their modification times
+        for file_name in ("copied.txt", "generated.txt"):
+            path = os.path.join(self.output_directory, file_name)
+            os.utime(path, (1000000000, 1000000000))
+        
+    def get_mtime(self, file_name):
+        return os.stat(os.path.join(self.output_directory, file_name)).st_mtime
+        
+    def test_up_to_date_files_untouched(self):
+        self.execute("World")
+        self.assertEqual(self.read("copied.txt"), "support file")
+        self.assertEqual(self.read("generated.txt"), "Hello, World!")
+        self.age_outputs()
+        self.execute("World")
+        self.assertEqual(self.get_mtime("copied.txt"), 1000000000)
+        self.assertEqual(self.get_mtime("generated.txt"), 1000000000)
+        
+    def test_changed_files_rewritten(self):
+        self.execute("World")
+        self.age_outputs()
+        
+        # A replaced plug-in file is copied again, even if its modification time is older
+        self.write(self.plugin_directory, "copied.txt", "replaced file", mtime=900000000)
+        self.execute("World")
+        self.assertEqual(self.read("copied.txt"), "replaced file")
+        self.assertEqual(self.get_mtime("generated.txt"), 1000000000)
+        
+        # Generated files are rewritten when the plug-in's output changes
+        self.execute("Everyone")
+        self.assertEqual(self.read("generated.txt"), "Hello, Everyone!")
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import sys
+sys.path.append("..")
+import os
+import os.path
+import shutil
+import tempfile
+import unittest
+from Generator.Emitter import FileTemplate
+
+class TestFileTemplate(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.template_file = os.path.join(self.directory, "template.txt")
+        
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        
+    def write_template(self, contents, mtime):
+        with open(self.template_file, 'w') as f:
+            f.write(contents)
+        os.utime(self.template_file, (mtime, mtime))
+        
+    def test_segments(self):
+        self.write_template("a $LOOSE b ${TIGHT}c\n    $LINE\n", 1000000000)
+        self.assertEqual(FileTemplate.parse_template(self.template_file), [
+            ("a ", "LOOSE", None),
+            (" b ", "TIGHT", None),
+            ("c\n", None, None),
+            ("", "LINE", 4)])
+        
+    def test_modified_template_reparsed(self):
+        self.write_template("$FIRST", 1000000000)
+        first = FileTemplate.parse_template(self.template_file)
+        self.assertTrue(FileTemplate.parse_template(self.template_file) is first)
+        
+        self.write_template("$SECOND", 1000000001)
+        second = FileTemplate.parse_template(self.template_file)
+        self.assertEqual(second, [("", "SECOND", 0)])
+        
+        # The old version of the template is replaced, not kept alongside the new one
+        path = os.path.abspath(self.template_file)
+        self.assertEqual(FileTemplate._template_cache[path], (1000000001, second))
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import sys
+sys.path.append("..")
+import os
+import os.path
+import json
+import shutil
+import tempfile
+import unittest
+from Generator import LanguagePlugins
+from Generator.LanguagePlugins import Parser
+
+class TestPluginFile(unittest.TestCase):
+    def assertEntryError(self, plugin_entry, message):
+        with self.assertRaises(Exception) as context:
+            Parser.parse_plugin_entry("test", plugin_entry, "Plugins")
+        self.assertEqual(str(context.exception), message)
+        
+    def test_valid_entry(self):
+        parsed = Parser.parse_plugin_entry("test", {
+            "Source": "Test/Test.py",
+            "Files": "Test/Template"
+        }, "Plugins")
+        self.assertEqual(parsed["Source"], os.path.join("Plugins", "Test/Test.py"))
+        self.assertEqual(parsed["Files"], os.path.join("Plugins", "Test/Template"))
+        self.assertEqual(parsed["Dependencies"], [])
+        self.assertEqual(parsed["Description"], "")
+        self.assertEqual(parsed["Forms"], set([LanguagePlugins.PluginOptions.DFA_IR]))
+        self.assertEqual(parsed["DefaultForm"], LanguagePlugins.PluginOptions.DFA_IR)
+        
+        parsed = Parser.parse_plugin_entry("test", {
+            "Source": "Test/Test.py",
+            "Files": "Test/Template",
+            "Dependencies": ["Test/Dependency.py"],
+            "Description": "Test plug-in",
+            "Forms": ["nfa", "DFA"],
+            "DefaultForm": "nfa"
+        }, "Plugins")
+        self.assertEqual(parsed["Dependencies"], [os.path.join("Plugins", "Test/Dependency.py")])
+        self.assertEqual(parsed["Description"], "Test plug-in")
+        self.assertEqual(parsed["Forms"], set([LanguagePlugins.PluginOptions.NFA_IR, LanguagePlugins.PluginOptions.DFA_IR]))
+        self.assertEqual(parsed["DefaultForm"], LanguagePlugins.PluginOptions.NFA_IR)
+        
+    def test_invalid_entries(self):
+        self.assertEntryError(["Source", "Files"], "Plugin 'test' is not a dictionary")
+        self.assertEntryError({"Source": "Test.py"}, "Plugin 'test' is missing required attribute 'Files'")
+        self.assertEntryError(
+            {"Source": "Test.py", "Files": "Template", "Forms": ["nfa", "pda"]},
+            "Plugin 'test' attribute 'Forms' must be a list of forms, each either 'nfa' or 'dfa'")
+        self.assertEntryError(
+            {"Source": "Test.py", "Files": "Template", "DefaultForm": "pda"},
+            "Plugin 'test' attribute 'DefaultForm' must be either 'nfa' or 'dfa'")
+        self.assertEntryError(
+            {"Source": "Test.py", "Files": "Template", "Dependencies": "Dependency.py"},
+            "Plugin 'test' attribute 'Dependencies' must be a list of paths")
+        self.assertEntryError(
+            {"Source": 1, "Files": "Template"},
+            "Plugin 'test' attribute 'Source' must be a path")
+        self.assertEntryError(
+            {"Source": "Test.py", "Files": "Template", "Forms": ["dfa"], "DefaultForm": "nfa"},
+            "Plugin 'test' default form is not one of its forms")
+            
+    def test_load_reports_invalid_entry(self):
+        directory = tempfile.mkdtemp()
+        try:
+            plugin_file = os.path.join(directory, "Plugins.json")
+            with open(plugin_file, "w") as f:
+                json.dump({
+                    "Version": 1,
+                    "Default": "good",
+                    "Plugins": {
+                        "good": {"Source": "Good.py", "Files": "Template"},
+                        "bad": {"Source": "Bad.py", "Files": "Template", "Forms": ["pda"]}
+                    }
+                }, f)
+            with self.assertRaises(Exception) as context:
+                Parser.load(plugin_file)
+            self.assertEqual(str(context.exception), "Plugin 'bad' attribute 'Forms' must be a list of forms, each either 'nfa' or 'dfa'")
+        finally:
+            shutil.rmtree(directory)
+            
+    def test_load_reports_invalid_id(self):
+        directory = tempfile.mkdtemp()
+        try:
+            plugin_file = os.path.join(directory, "Plugins.json")
+            with open(plugin_file, "w") as f:
+                json.dump({
+                    "Version": 1,
+                    "Default": "good",
+                    "Plugins": {
+                        "good": {"Source": "Good.py", "Files": "Template"},
+                        "c++!": {"Source": "Bad.py", "Files": "Template"}
+                    }
+                }, f)
+            with self.assertRaises(Exception) as context:
+                Parser.load(plugin_file)
+            self.assertEqual(str(context.exception), "Plugin ID 'c++!' is invalid")
+        finally:
+            shutil.rmtree(directory)
+            
+if __name__ == '__main__':
+    unittest.main()
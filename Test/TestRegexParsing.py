@@ -50,6 +50,11 @@ class TestRegexParser(unittest.TestCase):
         self.assertEqual(repr(parsed), repr(Regex.Literal([(0x1806, 0x1806)])))
         parsed = Regex.Parser(u"\p{na:MONGOLIAN-todo Soft_HYPHEN}").parse()
         self.assertEqual(repr(parsed), repr(Regex.Literal([(0x1806, 0x1806)])))
+        parsed = Regex.Parser(u"\\N{LATIN SMALL LETTER A}").parse()
+        self.assertEqual(repr(parsed), repr(Regex.Literal([(0x61, 0x61)])))
+        parsed = Regex.Parser(u"\\N{latin_small-letter a}b").parse()
+        self.assertEqual(repr(parsed), repr(Regex.Concatenation([
+            Regex.Literal([(0x61, 0x61)]), Regex.Literal([(0x62, 0x62)])])))
         parsed = Regex.Parser(u"\p{General Category=Pd}").parse()
         self.assertEqual(repr(parsed), repr(Regex.Literal([
             (0x2d, 0x2d), (0x58A, 0x58a), (0x5be, 0x5be), (0x1400, 0x1400), (0x1806, 0x1806),
@@ -177,6 +182,11 @@ class TestRegexParser(unittest.TestCase):
         self.assertRaises(RegexParserExpected, Regex.Parser(u"[\p{Name=}]").parse)
         self.assertRaises(RegexParserExpected, Regex.Parser(u"[\p{Name:]").parse)
         self.assertRaises(RegexParserExpected, Regex.Parser(u"[\p{Name:}]").parse)
+        self.assertRaises(RegexParserExpected, Regex.Parser(u"\\N").parse)
+        self.assertRaises(RegexParserExpected, Regex.Parser(u"\\N{LATIN SMALL LETTER A").parse)
+        with self.assertRaises(ValueError) as context:
+            Regex.Parser(u"\\N{NOT A CHARACTER NAME}").parse()
+        self.assertEqual(str(context.exception), "Name 'NOTACHARACTERNAME' not found")
         
         # Set operations and groups
         self.assertRaises(RegexParserExpected, Regex.Parser(u"[[hello]").parse)
@@ -0,0 +1,54 @@
+import sys
+sys.path.append("..")
+import unittest
+from StringIO import StringIO
+from Generator import RulesFile
+from Generator import Automata
+from Generator.RulesFile.Lexer import RulesFileException
+
+class TestRuleErrors(unittest.TestCase):
+    def build(self, text):
+        rules_file = RulesFile.Parser.parse_stream(StringIO(text))
+        rules_file.accept(RulesFile.Traverser(RulesFile.Validator()))
+        return RulesFile.NonDeterministicIR(rules_file)
+        
+    def assertBuildError(self, text, message):
+        with self.assertRaises(RulesFileException) as context:
+            self.build(text)
+        self.assertEqual(str(context.exception), message)
+        
+    def test_pattern_errors(self):
+        # Errors in a rule's own pattern are reported against the rule
+        self.assertBuildError("Foo: '[b-a]'\n", "On line 1, rule 'Foo': Invalid Range: [b-a]")
+        self.assertBuildError("Foo: '\\N{NOPE}'\n", "On line 1, rule 'Foo': Name 'NOPE' not found")
+        self.assertBuildError("Skip: '[b-a]'\n", "On line 1, anonymous rule: Invalid Range: [b-a]")
+        
+    def test_variable_errors(self):
+        self.assertBuildError("Foo: '{undefined}'\n", "On line 1, rule 'Foo': Variable 'undefined' not defined")
+        self.assertBuildError("X: '{a..b}'\n", "On line 1, rule 'X': On line 1, invalid id 'a..b'")
+        self.assertBuildError(
+            "Let a = '{b}'\nLet b = '{a}'\nFoo: '{a}'\n",
+            "On line 3, rule 'Foo': Circular reference to variable 'a' not allowed")
+            
+        # Errors in a definition are reported against the definition, not the rule using it
+        self.assertBuildError("Let d = '[b-a]'\nFoo: '{d}'\n", "On line 1, Invalid Range: [b-a]")
+        
+    def test_section_errors(self):
+        self.assertBuildError("Foo: 'x' Enter Nowhere\n", "On line 1, rule 'Foo': section 'Nowhere' not found")
+        
+    def test_valid_rules(self):
+        ir = self.build("Let d = 'b'\nFoo: '\\N{LATIN SMALL LETTER A}{d}'\nReserve Bar\n")
+        self.assertEqual([rule.name for rule in ir.sections['::main::'].rules], ['Foo'])
+        
+    def test_unexpected_errors_propagate(self):
+        def build(*args):
+            raise KeyError("unexpected")
+        original_build = Automata.NonDeterministicFiniteBuilder.__dict__['build']
+        Automata.NonDeterministicFiniteBuilder.build = staticmethod(build)
+        try:
+            self.assertRaises(KeyError, lambda: self.build("Foo: 'x'\n"))
+        finally:
+            Automata.NonDeterministicFiniteBuilder.build = original_build
+            
+if __name__ == '__main__':
+    unittest.main()
@@ -45,7 +45,7 @@ command, arguments = CommandArguments.handle()
 if command == 'list-minimizers':
     left_column_size = len(max(minimizers, key=lambda i: len(i))) + 1
     print("Supported DFA minimization algorithms:", file=sys.stderr)
-    for name, (description, minimizer) in minimizers.iteritems():
+    for name, (description, minimizer) in minimizers.items():
         print("    %s%s%s\n" % (name, ' '*(left_column_size-len(name)), description), file=sys.stderr)
     sys.exit(0)
 elif command == 'list-languages':